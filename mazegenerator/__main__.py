@@ -9,13 +9,51 @@ import sys
 import os
 from pathlib import Path  # Used to fix incompatibilities between windows and unix-based file paths ("/" vs "\\")
 
+# Third party
+from PIL import ImageColor  # Parses color names and hex codes
+
 # Relative imports
 from . import generate  # width/height --> matrix
 from . import create_output_image  # matrix --> image
+from . import create_tile_pyramid  # matrix --> deep zoom tiles
+from . import create_output_svg  # matrix --> vector image
+from . import create_output_text  # matrix --> text
 from . import strings  # Static strings
 from . import g  # global variables
 
 
+# File extensions that are stripped from the output name for each output format
+OUTPUT_EXTENSIONS = {
+	"jpg": (".jpg", ".jpeg"),
+	"dzi": (".dzi",),
+	"svg": (".svg",),
+	"txt": (".txt",),
+}
+
+
+# Color options and the create_output_image.render() argument they set
+COLOR_OPTIONS = {
+	"--wall-colour": "wall_color", "--wall-color": "wall_color",
+	"--path-colour": "path_color", "--path-color": "path_color",
+	"--start-colour": "start_color", "--start-color": "start_color",
+	"--end-colour": "end_color", "--end-color": "end_color",
+}
+
+
+def strip_extension(name, output_format):
+	"""
+	Removes any file extension belonging to the output format from a file name.
+
+	:param name: The file name
+	:param output_format: A key of OUTPUT_EXTENSIONS
+	:return: The file name without the extension
+	"""
+	for extension in OUTPUT_EXTENSIONS[output_format]:
+		name = name.replace(extension, "")
+
+	return name
+
+
 def cmd_error(message=""):  # Display error message and exit the program with exit code 1
 	"""
 	Displays a user-friendly error message and exits 1
@@ -58,10 +96,16 @@ def main():
 	Exit code 0 if successful, code 1 if error occurs
 	"""
 	output_path = ""  # The path for the picture to be outputted to
+	output_format = "jpg"
+	tile_size = 256
+	render_options = {}  # Keyword arguments for create_output_image.render()
 	width: int = 0
 	height: int = 0
+	max_run = None
+	carve_budget = None
 
 	option_no_noise = False
+	option_rle = False
 	option_more_paths = False
 	option_more_walls = False
 
@@ -106,10 +150,45 @@ def main():
 				width = int(cmd_args[index + 1])
 				skip_next_arg = True
 
+			elif arg in ("-f", "--format"):
+				output_format = cmd_args[index + 1].lower().lstrip(".")
+				skip_next_arg = True
+
+			elif arg == "--tile-size":
+				tile_size = int(cmd_args[index + 1])
+				skip_next_arg = True
+
+			elif arg == "--cell-size":
+				render_options["cell_size"] = int(cmd_args[index + 1])
+				skip_next_arg = True
+
+			elif arg == "--wall-thickness":
+				render_options["wall_thickness"] = int(cmd_args[index + 1])
+				skip_next_arg = True
+
+			elif arg == "--corridor-width":
+				render_options["corridor_width"] = int(cmd_args[index + 1])
+				skip_next_arg = True
+
+			elif arg in COLOR_OPTIONS:
+				render_options[COLOR_OPTIONS[arg]] = ImageColor.getcolor(cmd_args[index + 1], "RGB")
+				skip_next_arg = True
+
 			elif arg in ("--seed", "-s"):
 				g.seed = cmd_args[index + 1]
 				skip_next_arg = True
 
+			elif arg == "--max-run":
+				max_run = int(cmd_args[index + 1])
+				skip_next_arg = True
+
+			elif arg == "--carve-budget":
+				carve_budget = int(cmd_args[index + 1])
+				skip_next_arg = True
+
+			elif arg == "--rle":
+				option_rle = True
+
 			elif arg == "--no-noise":
 				option_no_noise = True
 
@@ -125,9 +204,39 @@ def main():
 		except IndexError:  # If no parameter is passed when an arg expects it
 			cmd_error(f"Option '{arg}' requires an parameter.")
 
+		except ValueError:  # If a number or color was expected but not passed
+			cmd_error(f"Option '{arg}' was given an invalid parameter.")
+
+	if output_format not in OUTPUT_EXTENSIONS:
+		cmd_error(f"Format '{output_format}' not recognised.")
+
+	if tile_size < 1:
+		cmd_error("Tile size must be at least 1.")
+
+	if max_run is not None and max_run < 1:
+		cmd_error("Max run must be at least 1.")
+
+	if carve_budget is not None and carve_budget < 0:
+		cmd_error("Carve budget can't be negative.")
+
+	if output_format == "svg" and ("wall_thickness" in render_options or "corridor_width" in render_options):
+		cmd_error("Wall thickness and corridor width are not supported by the 'svg' format.")
+
+	if output_format in ("txt", "dzi") and render_options:
+		cmd_error(f"Sizes and colors are not supported by the '{output_format}' format.")
+
+	if option_rle and output_format != "txt":
+		cmd_error("'--rle' is only supported by the 'txt' format.")
+
+	try:  # Check the render options before spending time generating the maze
+		create_output_image.get_cell_sizes(render_options.get("cell_size", 1), render_options.get("wall_thickness"),
+		                                   render_options.get("corridor_width"))
+	except ValueError as error:
+		cmd_error(str(error))
+
 	# This block is designed to work if:
 	# 1. Only a directory name is passed with or without a trailing '/' eg Pictures/ and Pictures
-	# 2. An image name is passed with/without a .jpg or .jpeg extension  eg. mymaze.jpg and mymaze
+	# 2. An image name is passed with/without an extension of the format eg. mymaze.jpg and mymaze
 	# 3. A directory name is passed with an image name  eg. Pictures/mymaze.jpg or Pictures/mymaze
 	output_dir = str(Path.cwd())
 	output_name = "maze"
@@ -140,12 +249,12 @@ def main():
 				cmd_error("Invalid directory name.")
 
 			elif len(path_lst) == 1:  # If only image name is specified with no directory
-				output_name = path_lst[0].replace(".jpg", "").replace(".jpeg", "")
+				output_name = strip_extension(path_lst[0], output_format)
 
 			else:  # If directory and image name are specified
 				output_name = path_lst[-1]
 				output_dir = output_path[0:-len(output_name)]
-				output_name = output_name.replace(".jpg", "").replace(".jpeg", "")
+				output_name = strip_extension(output_name, output_format)
 
 	if not width or not height:
 		width = 50
@@ -164,6 +273,13 @@ def main():
 	elif option_more_walls:
 		noise_bias = "walls"
 
-	generate.generate(width, height, noise_bias)
+	generate.generate(width, height, noise_bias, max_run, carve_budget)
 
-	create_output_image.create(g.maze, output_dir, output_name)
+	if output_format == "dzi":
+		create_tile_pyramid.create(g.maze, output_dir, output_name, tile_size)
+	elif output_format == "txt":
+		create_output_text.create(g.maze, output_dir, output_name, option_rle)
+	elif output_format == "svg":
+		create_output_svg.create(g.maze, output_dir, output_name, **render_options)
+	else:
+		create_output_image.create(g.maze, output_dir, output_name, **render_options)
@@ -1,38 +1,148 @@
 ## create_final_image.py - Tommy Dougiamas
 """
-Converts a matrix into a black and white image, and saves it to a specified directory
+Converts a matrix into an image (black and white by default), and saves it to a specified directory
 """
 
-from PIL import Image  # Pillow >=6.0
+from PIL import Image, ImageChops  # Pillow >=6.0
 from pathlib import Path  # OS agnostic filesystem paths
 
+# Default colors for each type of cell
+WALL_COLOR = (0, 0, 0)
+PATH_COLOR = (255, 255, 255)
+START_COLOR = PATH_COLOR
+END_COLOR = PATH_COLOR
 
-def create(matrix: list, output_dir: str, output_name: str):
+# Maps cells to palette indices
+WALL_INDEX = 0
+PATH_INDEX = 1
+CELL_TO_INDEX = bytes.maketrans(b"#.se", bytes([WALL_INDEX, PATH_INDEX, 2, 3]))
+
+
+def _shift(image, dx: int, dy: int, fill: int):
+	"""
+	Moves an image without wrapping around, the uncovered area is filled with 'fill'.
+	"""
+	shifted = Image.new(image.mode, image.size, fill)
+	shifted.paste(image, (dx, dy))
+	return shifted
+
+
+def _grow(mask, amount: int):
+	"""
+	Grows the white area of a mask into the black area by 'amount' pixels in total per axis,
+	split between both sides. Each step doubles the reach so only log2(amount) passes are needed.
+	"""
+	for dx, dy in ((1, 0), (0, 1)):
+		for sign, side_amount in ((-1, amount // 2), (1, amount - amount // 2)):
+			reach = 0
+			while reach < side_amount:
+				step = min(reach + 1, side_amount - reach)
+				mask = ImageChops.lighter(mask, _shift(mask, dx * step * sign, dy * step * sign, 0))
+				reach += step
+
+	return mask
+
+
+def _index_mask(image, index: int):
 	"""
-	Void function that marks the solution path into the image with green and saves the image.
+	Gets a mask that is white where the image has the palette index 'index', and black everywhere else.
+	"""
+	return image.point([255 if value == index else 0 for value in range(256)])
+
+
+def get_cell_sizes(cell_size: int = 1, wall_thickness: int = None, corridor_width: int = None):
+	"""
+	Works out the cell size and wall thickness from the sizes passed to render() (see render.__doc__).
+
+	:raises ValueError: If the sizes can't be combined
+	:return: (cell_size, wall_thickness)
+	:rtype: tuple
+	"""
+	if wall_thickness is not None and corridor_width is not None:
+		if (wall_thickness + corridor_width) % 2:
+			raise ValueError("Wall thickness and corridor width must add up to an even number.")
+		cell_size = (wall_thickness + corridor_width) // 2
+
+	elif corridor_width is not None:
+		wall_thickness = cell_size * 2 - corridor_width
+
+	elif wall_thickness is None:
+		wall_thickness = cell_size
+
+	if cell_size < 1:
+		raise ValueError("Cell size must be at least 1.")
+
+	if not 0 < wall_thickness < cell_size * 2:
+		raise ValueError(f"Wall thickness and corridor width must both be between 1 and {cell_size * 2 - 1}.")
+
+	return cell_size, wall_thickness
+
+
+def render(matrix: list, cell_size: int = 1, wall_thickness: int = None, corridor_width: int = None,
+           wall_color: tuple = WALL_COLOR, path_color: tuple = PATH_COLOR,
+           start_color: tuple = START_COLOR, end_color: tuple = END_COLOR):
+	"""
+	Renders a matrix as an image, scaling every cell up to 'cell_size' pixels.
+
+	Walls and paths share the same grid, so making walls thinner makes the neighbouring paths wider.
+	A wall or corridor that is one cell wide is 'cell_size' pixels wide by default,
+	'wall_thickness' and 'corridor_width' move the boundary between them,
+	so that wall_thickness + corridor_width == 2 * cell_size.
+	If both are given 'cell_size' is worked out from them.
+	The start and end cells are never resized.
 
 	:param matrix: A matrix generated by generate.py (see generate.__doc__).
-	:param output_dir: String with User-supplied path to a directory where the image will be saved.
-	:param output_name: A name for the image file
+	:param cell_size: Width and height of a cell in pixels
+	:param wall_thickness: Width in pixels of a wall that is one cell thick
+	:param corridor_width: Width in pixels of a corridor that is one cell wide
+	:param wall_color: RGB (or RGBA, alpha is ignored) tuple for walls
+	:param path_color: RGB (or RGBA, alpha is ignored) tuple for paths
+	:param start_color: RGB (or RGBA, alpha is ignored) tuple for the start cell
+	:param end_color: RGB (or RGBA, alpha is ignored) tuple for the end cell
+	:raises ValueError: If the sizes can't be combined
+	:return: The rendered image
+	:rtype: PIL.Image.Image
 	"""
-	print("\nSaving Image... This may take a long time for bigger mazes")
+	cell_size, wall_thickness = get_cell_sizes(cell_size, wall_thickness, corridor_width)
 
-	# open the image that was inputted
-	output_image = Image.new("RGB", [len(matrix[0]), len(matrix)], (255, 255, 255))
+	size = (len(matrix[0]), len(matrix))
+	data = "".join("".join(row) for row in matrix).encode("ascii").translate(CELL_TO_INDEX)
 
-	for y in range(0, len(matrix)):
-		for x in range(0, len(matrix[-1])):
-			cell = matrix[y][x]
+	# Every cell becomes a palette index, so scaling and coloring never touch individual pixels in python
+	output_image = Image.frombytes("L", size, data)
+	output_image = output_image.resize((size[0] * cell_size, size[1] * cell_size), Image.NEAREST)
 
-			color = (0, 0, 0)  # By default color is black
+	# Paths and walls only ever grow into each other, the start and end always stay one cell
+	if wall_thickness != cell_size:
+		if wall_thickness < cell_size:  # Widen paths into the walls
+			grow_index, shrink_index = PATH_INDEX, WALL_INDEX
+		else:  # Widen walls into the paths
+			grow_index, shrink_index = WALL_INDEX, PATH_INDEX
 
-			if cell == "." or cell == "s" or cell == "e":
-				color = (255, 255, 255)  # Change color to black
+		grown = _grow(_index_mask(output_image, grow_index), abs(cell_size - wall_thickness))
+		overwritten = ImageChops.multiply(grown, _index_mask(output_image, shrink_index))
+		output_image.paste(grow_index, mask=overwritten)
 
-			output_image.putpixel((x, y), color)
+	# Only the RGB part of each color is used, an alpha channel would shift every color after it
+	output_image.putpalette([*wall_color[:3], *path_color[:3], *start_color[:3], *end_color[:3]])
+
+	return output_image.convert("RGB")
 
-	out_path = Path(f"{output_dir}/{output_name}.jpg")  # Where the image will be saved to
 
+def create(matrix: list, output_dir: str, output_name: str, **render_options):
+	"""
+	Void function that renders the matrix and saves the image.
+
+	:param matrix: A matrix generated by generate.py (see generate.__doc__).
+	:param output_dir: String with User-supplied path to a directory where the image will be saved.
+	:param output_name: A name for the image file
+	:param render_options: Keyword arguments passed to render()
+	"""
+	print("\nSaving Image... This may take a long time for bigger mazes")
+
+	output_image = render(matrix, **render_options)
+
+	out_path = Path(f"{output_dir}/{output_name}.jpg")  # Where the image will be saved to
 
 	output_image.save(out_path, subsampling=0, quality=100)  # Save the image with no compression or sub-sampling
 
@@ -0,0 +1,95 @@
+## create_output_svg.py
+"""
+Converts a matrix into an SVG vector image, and saves it to a specified directory.
+
+Walls are merged into rectangles instead of being drawn one cell at a time:
+consecutive walls in a row become one run, and identical runs in consecutive rows
+become one taller rectangle. This keeps file size proportional to the shape of the maze
+rather than its area.
+"""
+
+import re
+from pathlib import Path  # OS agnostic filesystem paths
+
+from .create_output_image import WALL_COLOR, PATH_COLOR, START_COLOR, END_COLOR
+
+WALL_RUN = re.compile(r"#+")
+
+
+def to_hex(color: tuple):
+	"""
+	Converts an RGB tuple into a hex color code. Example: (255, 0, 0) --> "#ff0000"
+	"""
+	return "#{:02x}{:02x}{:02x}".format(*color[:3])
+
+
+def get_wall_rectangles(matrix: list):
+	"""
+	Merges the walls of a matrix into rectangles, one row at a time.
+
+	:param matrix: A matrix generated by generate.py (see generate.__doc__).
+	:return: Generator of (x, y, width, height) tuples covering every wall exactly once
+	"""
+	open_rectangles = {}  # Maps the (start, end) of a run of walls to the row the run started on
+
+	for y, row in enumerate(matrix):
+		still_open = {}
+		for run in WALL_RUN.finditer("".join(row)):
+			span = run.span()
+			still_open[span] = open_rectangles.pop(span, y)
+
+		# Runs that didn't continue on this row are finished
+		for (start, end), top in open_rectangles.items():
+			yield start, top, end - start, y - top
+
+		open_rectangles = still_open
+
+	for (start, end), top in open_rectangles.items():
+		yield start, top, end - start, len(matrix) - top
+
+
+def create(matrix: list, output_dir: str, output_name: str, cell_size: int = 1,
+           wall_color: tuple = WALL_COLOR, path_color: tuple = PATH_COLOR,
+           start_color: tuple = START_COLOR, end_color: tuple = END_COLOR):
+	"""
+	Void function that writes the matrix to an SVG file, streaming it out one row at a time.
+
+	:param matrix: A matrix generated by generate.py (see generate.__doc__).
+	:param output_dir: String with User-supplied path to a directory where the image will be saved.
+	:param output_name: A name for the image file
+	:param cell_size: Displayed width and height of a cell, the drawing itself is resolution independent
+	:param wall_color: RGB tuple for walls
+	:param path_color: RGB tuple for paths
+	:param start_color: RGB tuple for the start cell
+	:param end_color: RGB tuple for the end cell
+	"""
+	if cell_size < 1:
+		raise ValueError("Cell size must be at least 1.")
+
+	print("\nSaving SVG...")
+
+	width = len(matrix[0])
+	height = len(matrix)
+
+	out_path = Path(f"{output_dir}/{output_name}.svg")  # Where the image will be saved to
+
+	with open(out_path, "w", encoding="utf-8") as svg_file:
+		svg_file.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width * cell_size}" '
+		               f'height="{height * cell_size}" viewBox="0 0 {width} {height}" shape-rendering="crispEdges">\n')
+		svg_file.write(f'<rect width="{width}" height="{height}" fill="{to_hex(path_color)}"/>\n')
+
+		# All walls are one path, each rectangle is a short relative subpath
+		svg_file.write(f'<path fill="{to_hex(wall_color)}" d="')
+		for x, y, rect_width, rect_height in get_wall_rectangles(matrix):
+			svg_file.write(f"M{x} {y}h{rect_width}v{rect_height}h-{rect_width}z\n")
+		svg_file.write('"/>\n')
+
+		# The start is always on the first row and the end on the last row
+		for row_index, cell, color in ((0, "s", start_color), (height - 1, "e", end_color)):
+			for x, value in enumerate(matrix[row_index]):
+				if value == cell:
+					svg_file.write(f'<rect x="{x}" y="{row_index}" width="1" height="1" fill="{to_hex(color)}"/>\n')
+
+		svg_file.write("</svg>\n")
+
+	print(f"Maze was saved at {out_path}")  # Make sure the user knows where the image was saved
@@ -0,0 +1,29 @@
+## create_output_text.py
+"""
+Converts a matrix into a text file, and saves it to a specified directory.
+See mazeutils.encode_maze() for the format.
+"""
+
+from pathlib import Path  # OS agnostic filesystem paths
+
+from . import mazeutils as mu
+
+
+def create(matrix: list, output_dir: str, output_name: str, rle: bool = False):
+	"""
+	Void function that saves the matrix as text, one line per row.
+
+	:param matrix: A matrix generated by generate.py (see generate.__doc__).
+	:param output_dir: String with User-supplied path to a directory where the file will be saved.
+	:param output_name: A name for the text file
+	:param rle: Bool indicating whether to run length encode the rows
+	"""
+	print("\nSaving text...")
+
+	out_path = Path(f"{output_dir}/{output_name}.txt")  # Where the file will be saved to
+
+	with open(out_path, "w", encoding="ascii", newline="\n") as text_file:
+		text_file.write(mu.encode_maze(matrix, rle))
+		text_file.write("\n")
+
+	print(f"Maze was saved at {out_path}")  # Make sure the user knows where the file was saved
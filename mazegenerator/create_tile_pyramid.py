@@ -0,0 +1,208 @@
+## create_tile_pyramid.py
+"""
+Converts a matrix into a Deep Zoom (DZI) tile pyramid, and saves it to a specified directory.
+
+The highest level maps each cell to one pixel, every level below it halves the resolution
+until the whole maze fits into a single pixel. Tiles are cut straight from the matrix,
+so the maze is never rendered as one giant image.
+
+Output layout (readable by OpenSeadragon and other deep zoom viewers):
+
+    <output_name>.dzi
+    <output_name>_files/<level>/<column>_<row>.<tile_format>
+"""
+
+import collections
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path  # OS agnostic filesystem paths
+
+from PIL import Image  # Pillow >=6.0
+import progress.bar  # Progress bars
+
+from . import g
+
+# Maps cells to greyscale pixels, walls are black and everything else is white
+CELL_TO_PIXEL = bytes.maketrans(b"#.se", bytes([0, 255, 255, 255]))
+
+# Keyword arguments passed to Image.save() for each supported tile format
+TILE_SAVE_OPTIONS = {
+	"png": {"format": "PNG", "optimize": True},
+	"jpg": {"format": "JPEG", "quality": 100},
+}
+
+DZI_TEMPLATE = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" Format="{tile_format}" Overlap="0" TileSize="{tile_size}">
+	<Size Width="{width}" Height="{height}"/>
+</Image>
+"""
+
+
+def get_max_level(width: int, height: int):
+	"""
+	Gets the highest level of the pyramid, the level where one cell is one pixel.
+
+	:param width: Width of the matrix
+	:param height: Height of the matrix
+	:rtype: int
+	"""
+	return math.ceil(math.log2(max(width, height, 1)))
+
+
+def get_level_size(width: int, height: int, level: int):
+	"""
+	Gets the size in pixels of a level of the pyramid.
+
+	:param width: Width of the matrix
+	:param height: Height of the matrix
+	:param level: The pyramid level, 0 being a single pixel
+	:return: (width, height) of the level
+	:rtype: tuple
+	"""
+	scale = 2 ** (get_max_level(width, height) - level)
+	return -(-width // scale), -(-height // scale)
+
+
+def get_descriptor(dzi_path):
+	"""
+	Reads the .dzi descriptor of a previously saved pyramid.
+
+	:param dzi_path: Path to the .dzi file
+	:return: The contents of the file, or None if it doesn't exist
+	"""
+	try:
+		with open(dzi_path, encoding="utf-8") as dzi_file:
+			return dzi_file.read()
+	except FileNotFoundError:
+		return None
+
+
+def _save_tile(tile_path: str, size: tuple, data: bytes, tile_format: str):
+	"""
+	Encodes greyscale pixel data and saves it as a tile, run inside worker processes.
+	"""
+	Image.frombytes("L", size, data).save(tile_path, **TILE_SAVE_OPTIONS[tile_format])
+
+
+def create(matrix: list, output_dir: str, output_name: str, tile_size: int = 256, tile_format: str = "png",
+           dirty_region: tuple = None, workers: int = None):
+	"""
+	Void function that renders the matrix as a tile pyramid and saves every tile and the .dzi descriptor.
+
+	:param matrix: A matrix generated by generate.py (see generate.__doc__).
+	:param output_dir: String with User-supplied path to a directory where the pyramid will be saved.
+	:param output_name: A name for the .dzi file, tiles are saved in '<output_name>_files'
+	:param tile_size: Width and height of each tile in pixels
+	:param tile_format: Either "png" or "jpg"
+	:param dirty_region: (top, left, bottom, right) cells that have changed since the pyramid was last saved.
+	                        Only tiles overlapping the region (or missing on disk) are re-encoded.
+	                        Every tile is still rendered in memory, because lower levels are built from
+	                        the levels above them, only encoding and saving are skipped.
+	                        If the existing .dzi doesn't match the maze size, tile size and tile format,
+	                        every tile is re-encoded. None means every tile is re-encoded.
+	:param workers: Number of processes used to encode tiles, defaults to the number of CPUs
+	"""
+	if tile_format not in TILE_SAVE_OPTIONS:
+		raise ValueError(f"Tile format '{tile_format}' not recognised.")
+
+	if tile_size < 1:
+		raise ValueError("Tile size must be at least 1.")
+
+	width = len(matrix[0])
+	height = len(matrix)
+	max_level = get_max_level(width, height)
+	workers = workers or os.cpu_count() or 1
+
+	out_path = Path(f"{output_dir}/{output_name}.dzi")
+	descriptor = DZI_TEMPLATE.format(tile_format=tile_format, tile_size=tile_size, width=width, height=height)
+
+	# Tiles saved with a different maze size or tile settings can't be kept
+	if dirty_region is not None and get_descriptor(out_path) != descriptor:
+		dirty_region = None
+
+	# Removed until every tile is saved, so an interrupted run can't be mistaken for a finished one
+	if os.path.exists(out_path):
+		os.remove(out_path)
+
+	tiles_dir = Path(f"{output_dir}/{output_name}_files")
+	level_sizes = []
+	total_tiles = 0
+	for level in range(max_level + 1):
+		level_width, level_height = get_level_size(width, height, level)
+		level_sizes.append((level_width, level_height))
+		total_tiles += -(-level_width // tile_size) * -(-level_height // tile_size)
+		os.makedirs(tiles_dir / str(level), exist_ok=True)
+
+	progress_bar = progress.bar.PixelBar(g.change_string_length("Saving tiles", 30), max=total_tiles)
+
+	# Encoding jobs that have been handed to the workers, capped so finished tiles don't pile up in memory
+	pending = collections.deque()
+	max_pending = workers * 4
+
+	def is_dirty(level, x, y, size, tile_path):
+		if dirty_region is None or not os.path.exists(tile_path):
+			return True
+
+		scale = 2 ** (max_level - level)
+		top, left, bottom, right = dirty_region
+		return y * scale < bottom and (y + size[1]) * scale > top \
+			and x * scale < right and (x + size[0]) * scale > left
+
+	def render_tile(level, column, row):
+		"""
+		Renders a tile, recursing into the four tiles it covers on the level above.
+		Only one branch of the pyramid is held in memory at a time.
+		"""
+		level_width, level_height = level_sizes[level]
+		x = column * tile_size
+		y = row * tile_size
+		size = (min(tile_size, level_width - x), min(tile_size, level_height - y))
+
+		if level == max_level:  # Cut the tile straight out of the matrix
+			data = "".join("".join(matrix_row[x:x + size[0]]) for matrix_row in matrix[y:y + size[1]])
+			tile = Image.frombytes("L", size, data.encode("ascii").translate(CELL_TO_PIXEL))
+
+		else:  # Stitch together the tiles from the level above and halve them
+			child_width, child_height = level_sizes[level + 1]
+			children_width = min(tile_size * 2, child_width - x * 2)
+			children_height = min(tile_size * 2, child_height - y * 2)
+			children = Image.new("L", (size[0] * 2, size[1] * 2))
+
+			for child_row in (row * 2, row * 2 + 1):
+				for child_column in (column * 2, column * 2 + 1):
+					if child_column * tile_size < child_width and child_row * tile_size < child_height:
+						child = render_tile(level + 1, child_column, child_row)
+						children.paste(child, ((child_column - column * 2) * tile_size, (child_row - row * 2) * tile_size))
+
+			# Odd edges are padded by repeating the last pixel, so every pixel is made from exactly a 2x2 block
+			if children_width < children.width:
+				children.paste(children.crop((children_width - 1, 0, children_width, children_height)), (children_width, 0))
+			if children_height < children.height:
+				children.paste(children.crop((0, children_height - 1, children.width, children_height)), (0, children_height))
+
+			tile = children.resize(size, Image.BOX)
+
+		tile_path = str(tiles_dir / str(level) / f"{column}_{row}.{tile_format}")
+		if is_dirty(level, x, y, size, tile_path):
+			if len(pending) >= max_pending:
+				pending.popleft().result()  # Re-raises any error from the worker
+
+			pending.append(executor.submit(_save_tile, tile_path, size, tile.tobytes(), tile_format))
+
+		progress_bar.next()
+		return tile
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		render_tile(0, 0, 0)
+
+		while pending:
+			pending.popleft().result()
+
+	progress_bar.finish()
+
+	with open(out_path, "w", encoding="utf-8") as dzi_file:  # Written last so viewers never see a half-written pyramid
+		dzi_file.write(descriptor)
+
+	print(f"Maze tiles were saved at {out_path}")
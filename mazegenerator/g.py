@@ -6,6 +6,12 @@ maze = []
 # Seed used to seed the RNG
 seed = ""
 
+# The most cells a single branch can carve, None for no limit
+max_run = None
+
+# How many more cells branches can carve in the current maze, None for no limit
+carve_budget = None
+
 
 def change_string_length(string, length):
 	"""
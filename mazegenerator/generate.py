@@ -29,6 +29,7 @@ Example output (5x5):
 # Standard libraries
 import os
 import random
+import time
 
 # Third party
 import progress.bar  # Progress bars
@@ -37,6 +38,9 @@ import progress.bar  # Progress bars
 from . import mazeutils as mu
 from . import g
 
+# (row, column) offsets for each direction a branch can travel in
+DIRECTION_OFFSETS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+
 
 def check_seed():
 	"""
@@ -82,6 +86,8 @@ def branch(coords: tuple, direction: str, no_exit: bool = False, noise_offset: f
 	"""
 	Branches out to the side of a target cell, either left, right or down, used to add tree like structure
 
+	The branch carves at most g.max_run cells, and never more than what is left of g.carve_budget.
+
 	:param coords: (x,y) indicating a cell position
 	:param direction: 'left', 'right' or 'down'
 	:param no_exit: Bool indicating whether to not stop randomly
@@ -89,33 +95,47 @@ def branch(coords: tuple, direction: str, no_exit: bool = False, noise_offset: f
 	:return: The cell that was last visited
 	:rtype: tuple
 	"""
-
-	while True:
+	maze = g.maze
+	last_row = len(maze) - 1
+	last_column = len(maze[0]) - 1
+	row, column = coords
+	row_step, column_step = DIRECTION_OFFSETS[direction]
+	down_chance = 0.45 + noise_offset
+
+	# A branch can never carve more cells than the maze has, so this is the same as no limit
+	max_cells = len(maze) * len(maze[0])
+	if g.max_run is not None:
+		max_cells = min(max_cells, g.max_run)
+	if g.carve_budget is not None:
+		max_cells = min(max_cells, g.carve_budget)
+
+	carved = 0
+	while carved < max_cells:
 		rand_float = random.random() + noise_offset
 		if rand_float < 0.05 and not no_exit:
-			return coords
+			break
 
-		neighbour_directions = mu.get_cell_neighbour_direction_names(coords, empty_cell="#")
+		# The cell in the branch's direction must be a wall that isn't part of the border
+		next_row = row + row_step
+		next_column = column + column_step
+		if not (0 < next_row < last_row and 0 < next_column < last_column) or maze[next_row][next_column] != "#":
+			break
+
+		if 0.05 < rand_float < down_chance:
+			next_row = row + 1
+			next_column = column
+			if next_row == last_row or maze[next_row][next_column] != "#":
+				break
 
-		if direction in neighbour_directions:
-			final_direction = direction
-			if 0.05 < rand_float < 0.45 + noise_offset:
-				final_direction = "down"
+		maze[next_row][next_column] = "."
+		row = next_row
+		column = next_column
+		carved += 1
 
-			try:
-				next_coords = mu.get_cell_neighbours(coords, "#", final_direction)[0]
-			except IndexError:
-				return coords
+	if g.carve_budget is not None:
+		g.carve_budget -= carved
 
-			if not mu.is_edge(next_coords):
-				if next_coords[0] == len(g.maze) - 1:
-					breakpoint()
-				mu.set_cell_value(next_coords, ".")
-				coords = next_coords
-			else:
-				return coords
-		else:
-			return coords
+	return row, column
 
 
 def init_solution_path():
@@ -236,13 +256,19 @@ def expand_rows(noise_offset: float):
 	progress_bar.finish()
 
 
-def generate(width: int, height: int, noise_bias: str):
+def generate(width: int, height: int, noise_bias: str, max_run: int = None, carve_budget: int = None):
 	"""
 	Main function that creates the maze.
 	:param width: Width of the matrix
 	:param height: Height of the matrix
 	:param noise_bias: Either "wall", "less", "none", or and empty string indicating no bias
+	:param max_run: The most cells a single branch can carve, None for no limit
+	:param carve_budget: The most cells all branches in the maze can carve together, None for no limit
 	"""
+	start_time = time.perf_counter()
+	g.max_run = max_run
+	g.carve_budget = carve_budget
+
 	check_seed()
 	init_maze(width, height)
 	init_solution_path()
@@ -261,3 +287,6 @@ def generate(width: int, height: int, noise_bias: str):
 		expand_rows(noise_offset)
 	else:
 		print("Only rendering solution path")
+
+	elapsed = time.perf_counter() - start_time
+	print(f"Generated {width * height} cells in {elapsed:.2f} seconds ({width * height / elapsed:.0f} cells/sec)")
@@ -3,18 +3,75 @@
 Some basic utilites for manipulating and displaying the variable g.maze.
 """
 import random
+import re
 
 from . import g
 
 maze = None
 
+# Matches two or more of the same cell in a row, and a run length encoded run
+REPEATED_CELLS = re.compile(r"([#.se])\1+")
+ENCODED_RUN = re.compile(r"([1-9]\d*)([#.se])")
+VALID_TEXT = re.compile(r"[#.se\n]*")
+
+
+def encode_maze(matrix: list = None, rle: bool = False):
+	"""
+	Converts a maze matrix to text, one line per row, using the same characters as the matrix.
+
+	With run length encoding repeated cells are written as a count followed by the cell,
+	e.g. "#####..s#" --> "5#2.s#"
+
+	:param matrix: A matrix generated by generate.py (see generate.__doc__), defaults to g.maze
+	:param rle: Bool indicating whether to run length encode the text
+	:return: The maze as text
+	:rtype: str
+	"""
+	if matrix is None:
+		matrix = g.maze
+
+	text = "\n".join(map("".join, matrix))
+
+	if rle:
+		text = REPEATED_CELLS.sub(lambda run: f"{len(run.group(0))}{run.group(1)}", text)
+
+	return text
+
+
+def decode_maze(text: str):
+	"""
+	Converts text created by encode_maze() back into a maze matrix, run length encoded or not.
+
+	:param text: The maze as text
+	:raises ValueError: If the text is empty, contains unknown characters, zero run lengths or rows of different lengths
+	:return: The maze matrix
+	:rtype: list
+	"""
+	text = ENCODED_RUN.sub(lambda run: run.group(2) * int(run.group(1)), text.replace("\r\n", "\n"))
+
+	if not VALID_TEXT.fullmatch(text):
+		raise ValueError("Maze text can only contain '#', '.', 's', 'e', run lengths above 0 and line breaks.")
+
+	rows = text.split("\n")
+	if rows[-1] == "":  # A single trailing line break is allowed, as written by create_output_text
+		rows.pop()
+
+	matrix = list(map(list, rows))
+
+	if not matrix or not matrix[0]:
+		raise ValueError("Maze text is empty.")
+
+	if len(set(map(len, matrix))) != 1:
+		raise ValueError("Every row of the maze must be the same length.")
+
+	return matrix
+
 
 def print_maze():
 	"""
 	Prints out the maze matrix in a human readable format, useful for debugging.
 	"""
-	for i in g.maze:
-		print(i)
+	print(encode_maze())
 	print("\n")
 
 
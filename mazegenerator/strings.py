@@ -17,15 +17,36 @@ Valid Commands
 --no-noise      -  Render a solution path without any noise
 --favour-paths  -  Generate more paths
 --favour-walls  -  Generate more walls
+--max-run       -  The most cells a single random branch can carve, keeps generation time predictable
+--carve-budget  -  The most cells all random branches in the maze can carve together
+
+--cell-size       -  Width and height of each cell in pixels (default 1)
+                     Sizes and colors only apply to 'jpg' and 'svg' output, thickness and width to 'jpg' only
+--wall-thickness  -  Width of a one cell wall in pixels, paths are widened to make up for it
+--corridor-width  -  Width of a one cell corridor in pixels, walls are widened to make up for it
+--wall-colour     -  Color of walls, as a name or hex code eg. black or #000000
+--path-colour     -  Color of paths
+--start-colour    -  Color of the start cell
+--end-colour      -  Color of the end cell
 
 -s, --seed      -  Specifies a seed to be used for the random number generator
 -o, --output    -  Output filepath/directory
+-f, --format    -  Output format, either 'jpg' (default), 'svg', 'txt' or 'dzi'
+                   'svg' saves a vector image, handy for printing
+                   'txt' saves one line per row using the characters '#', '.', 's' and 'e'
+                   'dzi' saves a deep zoom tile pyramid for browsing huge mazes
+--rle           -  Run length encode 'txt' output, e.g. '#####..s#' is saved as '5#2.s#'
+--tile-size     -  Width and height of each 'dzi' tile in pixels (default 256)
 
 Example Usages 
 ---------------
 mazegenerator -x 300 -y 2000 -o path/to/dir/my_cool_maze_name
 mazegenerator --xy 600 --favour-paths
 mazegenerator --xy 200 -o path/to/dir/
+mazegenerator --xy 2000 --cell-size 8 --wall-thickness 4 --end-colour red
+mazegenerator --xy 500 -f svg --cell-size 10
+mazegenerator --xy 1000 -f txt --rle
+mazegenerator --xy 20000 -f dzi -o path/to/dir/huge_maze
 
 Contact Info
 ---------------
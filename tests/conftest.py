@@ -0,0 +1,32 @@
+"""
+Fixtures shared by every test module.
+"""
+
+import pytest
+
+from mazegenerator import generate
+from mazegenerator import g
+
+# (seed, width, height, noise_bias) of the mazes passed to output tests
+MAZE_CASES = [
+	("a", 20, 20, "default"),
+	("seed", 45, 33, "walls"),
+	("MAZE", 64, 40, "paths"),
+	("12345", 30, 60, "none"),
+]
+
+
+@pytest.fixture(params=MAZE_CASES, ids=lambda case: "-".join(map(str, case)))
+def maze(request):
+	"""
+	A generated maze matrix.
+	"""
+	seed, width, height, noise_bias = request.param
+	g.seed = seed
+	generate.generate(width, height, noise_bias)
+	matrix = g.maze
+
+	yield matrix
+
+	g.seed = ""
+	g.maze = []
@@ -0,0 +1,179 @@
+"""
+Tests for generate.py, checking every maze follows strings.MAZE_RULES and that the output for a seed never changes.
+
+Run with `python -m pytest` from the root of the repository.
+"""
+
+import collections
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from mazegenerator import generate
+from mazegenerator import mazeutils as mu
+from mazegenerator import g
+
+SEEDS = ["a", "b", "seed", "MAZE", "12345", "xYz0", "longer seed value", "7"]
+SIZES = [(20, 20), (20, 45), (45, 20), (33, 27), (64, 64)]
+NOISE_BIASES = ["default", "walls", "paths", "none"]
+
+# Large mazes are generated in parallel, one process per maze
+LARGE_CASES = [
+	("large", 500, 500, "default"),
+	("large", 300, 1000, "paths"),
+	("large", 1000, 300, "walls"),
+	("large", 800, 800, "none"),
+]
+
+# sha256 of mazeutils.encode_maze() for (seed, width, height, noise_bias)
+# If one of these changes, mazes generated from existing seeds will look different.
+GOLDEN_HASHES = {
+	("a", 20, 20, "default"): "7d9bcc4050a1e6b845658e2f5ab41ee1a8e973fc0b87b3f47a582ec805788779",
+	("b", 50, 30, "default"): "0fc533df183ff6071b986970578a9c6f7927aa9cf497fe5f8518606e2adc9c05",
+	("seed", 64, 64, "walls"): "69165fab37ca483afaefd64fcd3b6ef71c37c4238cd408eedc04a3d7e6f4ec1d",
+	("MAZE", 40, 80, "paths"): "058930a41b9d8dfa2f04e596badc05849dc4fcab1ed2b9f156b0acc7cfd35f5c",
+	("12345", 100, 100, "none"): "b5a8771aeb8cd5e3b439dd19d9d7c606324e64866482e0fc0cc3a08d8434f3e7",
+	("xYz0", 200, 150, "default"): "bd0a506d83a41a04892286c30b65950581ad8b400ee927cc941d2dd8acdde196",
+	("large", 500, 500, "default"): "2f25e2a70b0eb60810c29c390aecc14e2334e61ee53f46ffc2c50bb567a79d5c",
+	("large", 300, 1000, "paths"): "268a5c0bdd5a36c5a028617e25193552230f0dea7f377aafd86000ef23c63d17",
+	("large", 1000, 300, "walls"): "8a748f299e11cdb4c28799072ea421b3acc1e11d9f12bfa45bc1545b45d782b0",
+	("large", 800, 800, "none"): "c91816c334df307d53c41e4bff5eb735cf905490b74f085ad64cc080e7e5a92f",
+}
+
+
+def generate_maze(seed: str, width: int, height: int, noise_bias: str):
+	"""
+	Generates a maze from a seed and returns the matrix.
+	"""
+	g.seed = seed
+	generate.generate(width, height, noise_bias)
+	return g.maze
+
+
+def hash_maze(matrix: list):
+	"""
+	Gets the sha256 hex digest of a matrix in the text format.
+	"""
+	return hashlib.sha256(mu.encode_maze(matrix).encode("ascii")).hexdigest()
+
+
+def check_maze_rules(matrix: list, width: int, height: int):
+	"""
+	Asserts that a matrix follows every rule in strings.MAZE_RULES, and that the end can be reached from the start.
+	"""
+	assert len(matrix) == height
+	assert all(len(row) == width for row in matrix)
+
+	text = mu.encode_maze(matrix)
+	assert set(text) <= set("#.se\n")
+
+	# Walls around the entire maze, except for the entrance and exit
+	assert set(matrix[0]) == {"#", "s"}
+	assert set(matrix[-1]) == {"#", "e"}
+	assert all(row[0] == "#" and row[-1] == "#" for row in matrix)
+
+	# One entrance on the top row and one exit on the bottom row
+	assert text.count("s") == 1 and matrix[0].count("s") == 1
+	assert text.count("e") == 1 and matrix[-1].count("e") == 1
+
+	# The exit can be reached from the entrance, searched over the flat text (rows are width + 1 long)
+	row_length = width + 1
+	start = text.index("s")
+	end = text.index("e")
+	visited = {start}
+	queue = collections.deque([start])
+	while queue:
+		index = queue.popleft()
+		for neighbour in (index - row_length, index + row_length, index - 1, index + 1):
+			if 0 <= neighbour < len(text) and neighbour not in visited and text[neighbour] in ".se":
+				visited.add(neighbour)
+				queue.append(neighbour)
+
+	assert end in visited, "The exit can't be reached from the entrance"
+
+
+def generate_and_check(seed: str, width: int, height: int, noise_bias: str):
+	"""
+	Generates a maze, checks it and returns its hash. Run inside worker processes for the large cases.
+	"""
+	matrix = generate_maze(seed, width, height, noise_bias)
+	check_maze_rules(matrix, width, height)
+	return hash_maze(matrix)
+
+
+@pytest.fixture(autouse=True)
+def reset_globals():
+	"""
+	Stops the seed and maze of one test leaking into the next.
+	"""
+	yield
+	g.seed = ""
+	g.maze = []
+	g.max_run = None
+	g.carve_budget = None
+
+
+@pytest.mark.parametrize("noise_bias", NOISE_BIASES)
+@pytest.mark.parametrize("width, height", SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_maze_rules(seed, width, height, noise_bias):
+	check_maze_rules(generate_maze(seed, width, height, noise_bias), width, height)
+
+
+def test_random_seed_follows_maze_rules():
+	matrix = generate_maze("", 50, 50, "default")
+	assert g.seed  # A random seed was created
+	check_maze_rules(matrix, 50, 50)
+
+
+@pytest.mark.parametrize("seed, width, height, noise_bias", [case for case in GOLDEN_HASHES if case not in LARGE_CASES])
+def test_golden_hash(seed, width, height, noise_bias):
+	assert generate_and_check(seed, width, height, noise_bias) == GOLDEN_HASHES[(seed, width, height, noise_bias)]
+
+
+def test_same_seed_same_maze():
+	first = hash_maze(generate_maze("repeat", 80, 60, "default"))
+	second = hash_maze(generate_maze("repeat", 80, 60, "default"))
+	assert first == second
+
+
+def test_large_mazes():
+	with ProcessPoolExecutor(max_workers=len(LARGE_CASES)) as executor:
+		hashes = list(executor.map(generate_and_check, *zip(*LARGE_CASES)))
+
+	for case, maze_hash in zip(LARGE_CASES, hashes):
+		assert maze_hash == GOLDEN_HASHES[case], f"Output changed for {case}"
+
+
+@pytest.mark.parametrize("noise_bias", NOISE_BIASES)
+@pytest.mark.parametrize("max_run, carve_budget", [(1, None), (5, None), (None, 0), (None, 100), (3, 50)])
+def test_limits_follow_maze_rules(max_run, carve_budget, noise_bias):
+	g.seed = "limits"
+	generate.generate(64, 64, noise_bias, max_run, carve_budget)
+	check_maze_rules(g.maze, 64, 64)
+
+	if carve_budget is not None:
+		assert 0 <= g.carve_budget <= carve_budget
+
+
+def test_branch_stops_at_max_run():
+	generate.init_maze(20, 20)
+	g.max_run = 3
+	g.carve_budget = None
+
+	generate.branch((1, 1), "right", no_exit=True)
+	assert mu.encode_maze().count(".") == 3
+
+
+def test_branch_spends_carve_budget():
+	generate.init_maze(20, 20)
+	g.max_run = None
+	g.carve_budget = 2
+
+	generate.branch((1, 1), "right", no_exit=True)
+	assert mu.encode_maze().count(".") == 2
+	assert g.carve_budget == 0
+
+	generate.branch((10, 1), "right", no_exit=True)
+	assert mu.encode_maze().count(".") == 2
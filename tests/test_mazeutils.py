@@ -0,0 +1,48 @@
+"""
+Tests for the text format in mazeutils.py.
+
+Run with `python -m pytest` from the root of the repository.
+"""
+
+import pytest
+
+from mazegenerator import mazeutils as mu
+
+
+@pytest.mark.parametrize("text", [
+	"",  # Empty
+	"\n",  # Only a line break
+	"## ##\n##\n##",  # Space inside a row
+	"##\t\n##",  # Tab at the end of a row
+	"##\r##",  # Lone carriage return
+	"#x#\n###",  # Unknown cell
+	"0#\n#",  # Zero run length
+	"01#\n#",  # Zero padded run length
+	"##\n\n##",  # Blank line between rows
+	"\n##\n##",  # Blank first line
+	"##\n##\n\n",  # More than one trailing line break
+	"###\n##",  # Rows of different lengths
+	"3#\n2#",  # Run length encoded rows of different lengths
+])
+def test_decode_rejects_malformed_text(text):
+	with pytest.raises(ValueError):
+		mu.decode_maze(text)
+
+
+@pytest.mark.parametrize("text, matrix", [
+	("#s#\n#.#\n#e#", [["#", "s", "#"], ["#", ".", "#"], ["#", "e", "#"]]),
+	("#s#\n#.#\n#e#\n", [["#", "s", "#"], ["#", ".", "#"], ["#", "e", "#"]]),
+	("#s#\r\n#.#\r\n#e#\r\n", [["#", "s", "#"], ["#", ".", "#"], ["#", "e", "#"]]),
+	("10#\n#8.#", [["#"] * 10, ["#"] + ["."] * 8 + ["#"]]),
+])
+def test_decode(text, matrix):
+	assert mu.decode_maze(text) == matrix
+
+
+@pytest.mark.parametrize("rle", [False, True])
+def test_round_trip(maze, rle):
+	assert mu.decode_maze(mu.encode_maze(maze, rle)) == maze
+
+
+def test_rle_is_shorter(maze):
+	assert len(mu.encode_maze(maze, rle=True)) < len(mu.encode_maze(maze))
@@ -0,0 +1,183 @@
+"""
+Tests for the output modules, checking every format matches the matrix it was created from.
+
+Run with `python -m pytest` from the root of the repository.
+"""
+
+import os
+
+import pytest
+from PIL import Image
+
+from mazegenerator import create_output_image
+from mazegenerator import create_output_svg
+from mazegenerator import create_tile_pyramid
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def expected_pixels(matrix: list):
+	"""
+	Gets the pixels of a matrix rendered with one pixel per cell in the default colors, as RGB bytes.
+	"""
+	return b"".join(bytes(create_output_image.WALL_COLOR if cell == "#" else create_output_image.PATH_COLOR)
+	                for row in matrix for cell in row)
+
+
+def test_render_matches_matrix(maze):
+	output_image = create_output_image.render(maze)
+	assert output_image.size == (len(maze[0]), len(maze))
+	assert output_image.tobytes() == expected_pixels(maze)
+
+
+@pytest.mark.parametrize("cell_size", [2, 5, 8])
+def test_render_cell_size(maze, cell_size):
+	output_image = create_output_image.render(maze, cell_size=cell_size)
+	assert output_image.size == (len(maze[0]) * cell_size, len(maze) * cell_size)
+
+	# Scaling back down with nearest neighbour gives back one pixel per cell
+	assert output_image.resize((len(maze[0]), len(maze)), Image.NEAREST).tobytes() == expected_pixels(maze)
+
+
+@pytest.mark.parametrize("wall_thickness", [2, 4, 7, 9, 12, 14])
+def test_render_start_and_end_stay_one_cell(maze, wall_thickness):
+	output_image = create_output_image.render(maze, cell_size=8, wall_thickness=wall_thickness,
+	                                          start_color=RED, end_color=BLUE)
+	colors = dict((color, count) for count, color in output_image.getcolors())
+
+	assert colors[RED] == 8 * 8
+	assert colors[BLUE] == 8 * 8
+
+
+@pytest.mark.parametrize("sizes", [
+	{"cell_size": 0},
+	{"wall_thickness": 0},
+	{"cell_size": 2, "wall_thickness": 4},
+	{"cell_size": 2, "corridor_width": 4},
+	{"wall_thickness": 3, "corridor_width": 4},
+])
+def test_render_rejects_bad_sizes(sizes):
+	with pytest.raises(ValueError):
+		create_output_image.render([["#"]], **sizes)
+
+
+def test_svg_rectangles_cover_walls(maze):
+	covered = [[0] * len(maze[0]) for _ in maze]
+	for x, y, width, height in create_output_svg.get_wall_rectangles(maze):
+		for row in range(y, y + height):
+			for column in range(x, x + width):
+				covered[row][column] += 1
+
+	assert covered == [[int(cell == "#") for cell in row] for row in maze]
+
+
+def test_dzi_top_level_matches_matrix(maze, tmp_path):
+	tile_size = 16
+	create_tile_pyramid.create(maze, str(tmp_path), "maze", tile_size=tile_size, workers=2)
+
+	width = len(maze[0])
+	height = len(maze)
+	expected = Image.frombytes("L", (width, height), expected_pixels(maze)[::3])
+	max_level = create_tile_pyramid.get_max_level(width, height)
+
+	for row in range(0, -(-height // tile_size)):
+		for column in range(0, -(-width // tile_size)):
+			tile = Image.open(tmp_path / "maze_files" / str(max_level) / f"{column}_{row}.png")
+			box = (column * tile_size, row * tile_size,
+			       min(width, (column + 1) * tile_size), min(height, (row + 1) * tile_size))
+			assert tile.tobytes() == expected.crop(box).tobytes()
+
+	assert (tmp_path / "maze_files" / "0" / "0_0.png").exists()
+	assert (tmp_path / "maze.dzi").exists()
+
+
+def test_render_ignores_alpha(maze):
+	output_image = create_output_image.render(maze, wall_color=(0, 0, 0, 128), path_color=(255, 255, 255, 0),
+	                                          start_color=(*RED, 255), end_color=(*BLUE, 255))
+	colors = dict((color, count) for count, color in output_image.getcolors())
+
+	assert set(colors) == {create_output_image.WALL_COLOR, create_output_image.PATH_COLOR, RED, BLUE}
+	assert colors[RED] == 1 and colors[BLUE] == 1
+
+
+def test_dzi_lower_levels_halve_the_level_above(tmp_path):
+	# 41x27 gives odd widths and heights on several levels
+	matrix = [["#" if (x * 7 + y * 3) % 5 else "." for x in range(41)] for y in range(27)]
+	create_tile_pyramid.create(matrix, str(tmp_path), "maze", tile_size=1024, workers=1)
+
+	for level in range(create_tile_pyramid.get_max_level(41, 27)):
+		above = Image.open(tmp_path / "maze_files" / str(level + 1) / "0_0.png").load()
+		above_width, above_height = create_tile_pyramid.get_level_size(41, 27, level + 1)
+		tile = Image.open(tmp_path / "maze_files" / str(level) / "0_0.png")
+		assert tile.size == create_tile_pyramid.get_level_size(41, 27, level)
+
+		# Each pixel is the mean of a 2x2 block, the last row and column are repeated on odd edges
+		pixels = tile.load()
+		for y in range(tile.height):
+			for x in range(tile.width):
+				block = [above[min(block_x, above_width - 1), min(block_y, above_height - 1)]
+				         for block_x in (x * 2, x * 2 + 1) for block_y in (y * 2, y * 2 + 1)]
+				assert abs(pixels[x, y] - sum(block) / 4) <= 1
+
+
+def read_tiles(output_dir):
+	"""
+	Gets the contents of every saved tile, keyed by '<level>/<column>_<row>.png'.
+	"""
+	return {f"{tile.parent.name}/{tile.name}": tile.read_bytes() for tile in output_dir.glob("maze_files/*/*.png")}
+
+
+def reset_tile_times(output_dir):
+	"""
+	Sets the modified time of every saved tile to 0, so rewritten tiles can be told apart.
+	"""
+	for tile in output_dir.glob("maze_files/*/*.png"):
+		os.utime(tile, (0, 0))
+
+
+def rewritten_tiles(output_dir):
+	"""
+	Gets every tile written since reset_tile_times() was called.
+	"""
+	return {f"{tile.parent.name}/{tile.name}" for tile in output_dir.glob("maze_files/*/*.png") if tile.stat().st_mtime}
+
+
+def test_dzi_dirty_region_only_rewrites_overlapping_tiles(maze, tmp_path):
+	tile_size = 8
+	create_tile_pyramid.create(maze, str(tmp_path / "dirty"), "maze", tile_size=tile_size, workers=2)
+	reset_tile_times(tmp_path / "dirty")
+
+	row, column = 5, 6
+	maze[row][column] = "." if maze[row][column] == "#" else "#"
+	create_tile_pyramid.create(maze, str(tmp_path / "dirty"), "maze", tile_size=tile_size,
+	                           dirty_region=(row, column, row + 1, column + 1), workers=2)
+
+	# Exactly one tile per level covers the changed cell
+	max_level = create_tile_pyramid.get_max_level(len(maze[0]), len(maze))
+	expected = set()
+	for level in range(max_level + 1):
+		scale = 2 ** (max_level - level)
+		expected.add(f"{level}/{column // scale // tile_size}_{row // scale // tile_size}.png")
+	assert rewritten_tiles(tmp_path / "dirty") == expected
+
+	# Every tile, rewritten or kept, matches saving the changed maze from scratch
+	create_tile_pyramid.create(maze, str(tmp_path / "full"), "maze", tile_size=tile_size, workers=2)
+	assert read_tiles(tmp_path / "dirty") == read_tiles(tmp_path / "full")
+
+
+@pytest.mark.parametrize("changed_setting", [{"tile_size": 16}, {"tile_format": "jpg"}])
+def test_dzi_dirty_region_rewrites_everything_when_settings_change(maze, tmp_path, changed_setting):
+	create_tile_pyramid.create(maze, str(tmp_path / "dirty"), "maze", tile_size=8, workers=2)
+	reset_tile_times(tmp_path / "dirty")
+
+	settings = {"tile_size": 8, "tile_format": "png", **changed_setting}
+	create_tile_pyramid.create(maze, str(tmp_path / "dirty"), "maze", dirty_region=(0, 0, 1, 1), workers=2, **settings)
+	create_tile_pyramid.create(maze, str(tmp_path / "full"), "maze", workers=2, **settings)
+
+	tile_pattern = f"maze_files/*/*.{settings['tile_format']}"
+	full_tiles = {f"{tile.parent.name}/{tile.name}" for tile in (tmp_path / "full").glob(tile_pattern)}
+	for tile_name in full_tiles:
+		tile = tmp_path / "dirty" / "maze_files" / tile_name
+		assert tile.stat().st_mtime, f"{tile_name} was not rewritten"
+		assert tile.read_bytes() == (tmp_path / "full" / "maze_files" / tile_name).read_bytes()